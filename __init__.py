@@ -1,24 +1,35 @@
 """EmmeTI Febos integration for Home Assistant."""
 
 from febos.api import FebosApi
-from febos.errors import FebosError
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import LOGGER, PLATFORMS
+from .const import (
+    CONF_MIN_AGE,
+    DEFAULT_MIN_AGE,
+    DOMAIN,
+    PLATFORMS,
+    STORAGE_VERSION,
+)
 from .coordinator import FebosConfigEntry, FebosDataUpdateCoordinator
 from .febos import FebosClient
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 def create_api(username: str, password: str) -> FebosApi:
-    try:
-        api = FebosApi(username, password)
-        api.login()
-    except FebosError as e:
-        LOGGER.error(str(e))
-    else:
-        return api
-    return None
+    """Create the API client; login is deferred to discovery."""
+    return FebosApi(username, password)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the EmmeTI Febos services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: FebosConfigEntry) -> bool:
@@ -26,10 +37,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: FebosConfigEntry) -> boo
     api = await hass.async_add_executor_job(
         create_api, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]
     )
-    if api is None:
-        return False
-    client = FebosClient(api=api)
+    client = FebosClient(
+        api=api, min_age=entry.options.get(CONF_MIN_AGE, DEFAULT_MIN_AGE)
+    )
     entry.runtime_data = FebosDataUpdateCoordinator(hass, entry, client)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    await entry.runtime_data.async_restore_session()
+    if await entry.runtime_data.async_restore():
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_create_background_task(
+            hass, entry.runtime_data.async_start(), f"{DOMAIN}_{entry.entry_id}_start"
+        )
+        return True
     await entry.runtime_data.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -38,3 +57,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: FebosConfigEntry) -> boo
 async def async_unload_entry(hass: HomeAssistant, entry: FebosConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: FebosConfigEntry) -> None:
+    """Reload a config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: FebosConfigEntry) -> None:
+    """Remove the startup cache and session of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.session", private=True
+    ).async_remove()
@@ -10,16 +10,13 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import LOGGER
 from .coordinator import FebosConfigEntry, FebosDataUpdateCoordinator
+from .entity import FebosEntity, async_setup_resource_entities
 from .febos import FebosResourceData
 
 
-class FebosBinarySensorEntity(
-    CoordinatorEntity[FebosDataUpdateCoordinator], BinarySensorEntity
-):
+class FebosBinarySensorEntity(FebosEntity, BinarySensorEntity):
     """Defines an EmmeTI Febos binary sensor."""
 
     def __init__(
@@ -30,35 +27,16 @@ class FebosBinarySensorEntity(
         resource: FebosResourceData,
     ) -> None:
         """Initialize EmmeTI Febos sensor."""
-        super().__init__(coordinator)
-        self._attr_should_poll = False
+        super().__init__(coordinator, key, device_info, resource)
         self.entity_description = BinarySensorEntityDescription(
             key=key, name=resource.name, device_class=resource.sensor_class
         )
-        self._attr_unique_id = key
-        self._attr_device_info = device_info
-        self._attr_name = resource.name
-        self.resource = resource
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
         return self.resource.get_value()
 
-    @staticmethod
-    def create(
-        key: str, resource: FebosResourceData, coordinator: FebosDataUpdateCoordinator
-    ):
-        """Create an EmmeTI Febos sensor entity."""
-        entity = FebosBinarySensorEntity(
-            coordinator=coordinator,
-            key=key,
-            device_info=coordinator.client.services["_".join(key.split("_")[:-1])],
-            resource=resource,
-        )
-        resource.listener = entity.schedule_update_ha_state
-        return entity
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -66,10 +44,6 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up a config entry."""
-    sensors = [
-        FebosBinarySensorEntity.create(k, r, entry.runtime_data)
-        for k, r in entry.runtime_data.client.resources.items()
-        if r.type == Platform.BINARY_SENSOR and r.value is not None
-    ]
-    LOGGER.debug(f"Loading {len(sensors)} binary sensors.")
-    async_add_entities(sensors)
+    async_setup_resource_entities(
+        entry, async_add_entities, Platform.BINARY_SENSOR, FebosBinarySensorEntity
+    )
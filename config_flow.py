@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any
+
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, UnitOfTime
+from homeassistant.core import callback
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     TextSelector,
     TextSelectorConfig,
     TextSelectorType,
 )
 
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_BURST_DURATION,
+    CONF_BURST_INTERVAL,
+    CONF_BURST_TRIGGERS,
+    CONF_MIN_AGE,
+    CONF_STALE_AFTER,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_BURST_TRIGGERS,
+    DEFAULT_MIN_AGE,
+    DEFAULT_STALE_AFTER,
+    DOMAIN,
+    LOGGER,
+)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -37,12 +62,74 @@ STEP_REAUTH_DATA_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_STALE_AFTER, default=DEFAULT_STALE_AFTER): vol.All(
+            NumberSelector(
+                NumberSelectorConfig(
+                    min=60,
+                    max=86400,
+                    step=60,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Coerce(int),
+        ),
+        vol.Optional(CONF_MIN_AGE, default=DEFAULT_MIN_AGE): vol.All(
+            NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=300,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Coerce(int),
+        ),
+        vol.Optional(CONF_BURST_TRIGGERS, default=DEFAULT_BURST_TRIGGERS): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.TEXT, multiple=True)
+        ),
+        vol.Optional(CONF_BURST_INTERVAL, default=DEFAULT_BURST_INTERVAL): vol.All(
+            NumberSelector(
+                NumberSelectorConfig(
+                    min=5,
+                    max=60,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Coerce(int),
+        ),
+        vol.Optional(CONF_BURST_DURATION, default=DEFAULT_BURST_DURATION): vol.All(
+            NumberSelector(
+                NumberSelectorConfig(
+                    min=60,
+                    max=3600,
+                    step=60,
+                    mode=NumberSelectorMode.BOX,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                )
+            ),
+            vol.Coerce(int),
+        ),
+    }
+)
+
 
 class FebosConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> FebosOptionsFlow:
+        """Create the options flow."""
+        return FebosOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, str] | None = None
     ) -> ConfigFlowResult:
@@ -60,3 +147,44 @@ class FebosConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors={},
         )
+
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> ConfigFlowResult:
+        """Step when the stored credentials are rejected."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: dict[str, str] | None = None
+    ) -> ConfigFlowResult:
+        """Step when user enters the new password."""
+        if user_input is not None:
+            LOGGER.debug("[REAUTH] Updating entry")
+            return self.async_update_reload_and_abort(
+                self._get_reauth_entry(), data_updates=user_input
+            )
+        LOGGER.debug("[REAUTH] Showing form")
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            errors={},
+        )
+
+
+class FebosOptionsFlow(OptionsFlow):
+    """Handle an options flow."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Step when user changes the options."""
+        if user_input is not None:
+            LOGGER.debug("[OPTIONS] Updating entry")
+            return self.async_create_entry(data=user_input)
+        LOGGER.debug("[OPTIONS] Showing form")
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
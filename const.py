@@ -6,9 +6,38 @@ from homeassistant.const import Platform
 
 DOMAIN = "febos"
 
-PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.NUMBER, Platform.SENSOR]
+
+EVENT_REGISTERS_CHANGED = f"{DOMAIN}_registers_changed"
+
+WRITE_DEBOUNCE_COOLDOWN = 2.0
+
+CONF_STALE_AFTER = "stale_after"
+DEFAULT_STALE_AFTER = 600
+CONF_MIN_AGE = "min_age"
+DEFAULT_MIN_AGE = 5
+CONF_BURST_TRIGGERS = "burst_triggers"
+DEFAULT_BURST_TRIGGERS = [
+    "R9071",
+    "R9072",
+    "R9073",
+    "R9074",
+    "R9076",
+    "R9078",
+    "R9079",
+    "R16384",
+]
+CONF_BURST_INTERVAL = "burst_interval"
+DEFAULT_BURST_INTERVAL = 10
+CONF_BURST_DURATION = "burst_duration"
+DEFAULT_BURST_DURATION = 600
+
+STORAGE_VERSION = 1
+# Bump whenever resource parsing changes, to rebuild the cached resources.
+PARSER_VERSION = 1
+CACHE_SAVE_DELAY = 900
+SESSION_MAX_AGE = 43200
+DISCOVERY_RETRY_DELAY = 60
+DISCOVERY_RETRY_MAX_DELAY = 1800
 
 LOGGER = logging.getLogger(__package__)
-FORMAT = "[%(filename)s:%(lineno)s] [%(funcName)s()] %(message)s"
-logging.basicConfig(format=FORMAT)
-LOGGER.setLevel(logging.DEBUG)
@@ -2,15 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+import time
 from typing import Any
 
+from febos.errors import AuthenticationError, FebosError
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ServiceValidationError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER
-from .febos import FebosClient
+from .const import (
+    CACHE_SAVE_DELAY,
+    CONF_BURST_DURATION,
+    CONF_BURST_INTERVAL,
+    CONF_BURST_TRIGGERS,
+    CONF_STALE_AFTER,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_BURST_TRIGGERS,
+    DEFAULT_STALE_AFTER,
+    DISCOVERY_RETRY_DELAY,
+    DISCOVERY_RETRY_MAX_DELAY,
+    DOMAIN,
+    EVENT_REGISTERS_CHANGED,
+    LOGGER,
+    STORAGE_VERSION,
+    WRITE_DEBOUNCE_COOLDOWN,
+)
+from .febos import SETPOINT_MAP, FebosClient
+from .profiler import FebosProfiler, profiled
 
 type FebosConfigEntry = ConfigEntry[FebosDataUpdateCoordinator]
 
@@ -32,11 +59,284 @@ class FebosDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.entities = {}
         self.client = client
+        self.stale = set()
+        self.stale_after = config_entry.options.get(
+            CONF_STALE_AFTER, DEFAULT_STALE_AFTER
+        )
+        self.burst_triggers = set(
+            config_entry.options.get(CONF_BURST_TRIGGERS, DEFAULT_BURST_TRIGGERS)
+        )
+        self.burst_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL
+            )
+        )
+        self.burst_duration = config_entry.options.get(
+            CONF_BURST_DURATION, DEFAULT_BURST_DURATION
+        )
+        self._burst_triggered = False
+        self._burst_deadline = None
+        self._unsub_burst = None
+        self._write_debouncer = Debouncer(
+            hass,
+            LOGGER,
+            cooldown=WRITE_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self._async_write,
+        )
+        self.store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{config_entry.entry_id}")
+        self.session_store = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{config_entry.entry_id}.session",
+            private=True,
+        )
+        self._unsub_save = None
+        self._profiler = None
+        self.signal_new_resources = f"{DOMAIN}_{config_entry.entry_id}_new_resources"
 
     async def _async_setup(self):
         """Set up the coordinator."""
-        await self.hass.async_add_executor_job(self.client.discover)
+        try:
+            await self.hass.async_add_executor_job(self.client.discover)
+        except AuthenticationError as e:
+            raise ConfigEntryAuthFailed(str(e)) from e
+        except FebosError as e:
+            raise UpdateFailed(f"Unable to discover resources: {e}") from e
+        await self.store.async_save(self.client.as_dict())
+        await self._async_save_session()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Async update wrapper."""
-        return await self.hass.async_add_executor_job(self.client.update)
+        profiler = self._profiler
+        if profiler is None:
+            return await self._async_update()
+        await self.hass.async_add_executor_job(profiler.begin)
+        try:
+            return await self._async_update(profiler)
+        finally:
+            if await self.hass.async_add_executor_job(profiler.end):
+                self._profiler = None
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self._async_dump_profile(profiler),
+                    f"{DOMAIN}_{self.config_entry.entry_id}_profile",
+                )
+
+    async def _async_update(
+        self, profiler: FebosProfiler | None = None
+    ) -> dict[str, Any]:
+        """Fetch the data and dispatch it to the entities."""
+        try:
+            data = await self.hass.async_add_executor_job(
+                profiled(profiler, "update", self.client.update)
+            )
+        except AuthenticationError as e:
+            raise ConfigEntryAuthFailed(str(e)) from e
+        except FebosError as e:
+            raise UpdateFailed(str(e)) from e
+        if self.client.rediscover_queue:
+            try:
+                await self.hass.async_add_executor_job(
+                    profiled(profiler, "discover", self.client.rediscover)
+                )
+            except FebosError as e:
+                LOGGER.warning(f"Unable to rediscover resources: {e}")
+        await self._async_save_session()
+        profiled(profiler, "dispatch", self._async_dispatch)()
+        if self._unsub_save is None:
+            self._unsub_save = async_call_later(
+                self.hass, CACHE_SAVE_DELAY, self._async_save_cache
+            )
+        return data
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Dispatch the polled values to the event bus and the entities."""
+        self._async_fire_changes()
+        self._async_add_new_resources()
+        self._async_update_stale()
+        self._async_check_burst()
+
+    @callback
+    def async_profile(self, runs: int) -> None:
+        """Profile the next runs of the update pipeline."""
+        if self._profiler is not None:
+            raise ServiceValidationError("A profile is already being captured")
+        self._profiler = FebosProfiler(runs)
+
+    async def _async_dump_profile(self, profiler: FebosProfiler) -> None:
+        """Write the captured profile to the config directory."""
+        prefix = self.hass.config.path(
+            f"{DOMAIN}_profile_{self.config_entry.entry_id}_{int(time.time())}"
+        )
+        paths = await self.hass.async_add_executor_job(profiler.dump, prefix)
+        persistent_notification.async_create(
+            self.hass,
+            "Wrote " + ", ".join(paths),
+            title="EmmeTI Febos profile",
+        )
+
+    @callback
+    def _async_fire_changes(self) -> None:
+        """Fire a single event holding every register changed by the last poll."""
+        changes = self.client.pop_changes()
+        if not changes:
+            return
+        self.hass.bus.async_fire(
+            EVENT_REGISTERS_CHANGED,
+            {
+                "config_entry_id": self.config_entry.entry_id,
+                "changes": {
+                    key: {"code": code, "old": old, "new": new}
+                    for key, (code, old, new) in changes.items()
+                },
+            },
+        )
+
+    @callback
+    def _async_add_new_resources(self) -> None:
+        """Signal the platforms to add entities for newly valued resources."""
+        keys = [
+            k
+            for k, r in list(self.client.resources.items())
+            if r.value is not None and k not in self.entities
+        ]
+        if keys:
+            LOGGER.debug(f"Adding {len(keys)} new resources.")
+            async_dispatcher_send(self.hass, self.signal_new_resources, keys)
+
+    @callback
+    def _async_update_stale(self) -> None:
+        """Refresh the entities whose register became stale or fresh again."""
+        stale = self.client.freshness.stale(self.stale_after, time.time())
+        flipped = stale ^ self.stale
+        self.stale = stale
+        if flipped:
+            LOGGER.debug(f"{len(stale)} stale resources.")
+        for key in flipped:
+            for entity in self.entities.get(key, []):
+                if entity.hass is not None:
+                    entity.async_write_ha_state()
+
+    @callback
+    def _async_check_burst(self) -> None:
+        """Start a burst when a trigger register turns on."""
+        triggered = any(
+            r.get_value()
+            for r in list(self.client.resources.values())
+            if r.id in self.burst_triggers
+        )
+        if triggered and not self._burst_triggered and self._unsub_burst is None:
+            LOGGER.debug("Starting burst polling.")
+            self._burst_deadline = time.monotonic() + self.burst_duration
+            self._unsub_burst = async_track_time_interval(
+                self.hass,
+                self._async_burst_poll,
+                self.burst_interval,
+                cancel_on_shutdown=True,
+            )
+        self._burst_triggered = triggered
+
+    @callback
+    def _async_stop_burst(self) -> None:
+        """Fall back to the normal polling rate."""
+        if self._unsub_burst is not None:
+            LOGGER.debug("Stopping burst polling.")
+            self._unsub_burst()
+            self._unsub_burst = None
+
+    async def _async_burst_poll(self, _now=None) -> None:
+        """Poll the power and temperature groups at the burst rate."""
+        if time.monotonic() >= self._burst_deadline:
+            self._async_stop_burst()
+            return
+        try:
+            polled = await self.hass.async_add_executor_job(self.client.burst_update)
+        except FebosError as e:
+            LOGGER.debug(f"Burst poll failed: {e}")
+            return
+        if polled:
+            self._async_fire_changes()
+            self._async_update_stale()
+
+    @callback
+    def _async_save_cache(self, _now=None) -> None:
+        """Save the last known resources and values to the startup cache."""
+        self._unsub_save = None
+        self.store.async_delay_save(self.client.as_dict)
+
+    async def _async_save_session(self) -> None:
+        """Store the authenticated session after a new login."""
+        if not self.client.session_changed:
+            return
+        self.client.session_changed = False
+        if (data := self.client.export_session()) is not None:
+            await self.session_store.async_save(data)
+
+    async def async_restore_session(self) -> None:
+        """Reuse the stored session, if still valid, instead of logging in."""
+        data = await self.session_store.async_load()
+        if data and not self.client.restore_session(data):
+            LOGGER.debug("Stored session expired or not supported.")
+
+    async def async_restore(self) -> bool:
+        """Restore resources from the startup cache, if any."""
+        data = await self.store.async_load()
+        if not data:
+            return False
+        self.client.restore(data)
+        LOGGER.debug(f"Restored {len(self.client.resources)} resources.")
+        return True
+
+    async def async_start(self) -> None:
+        """Log in, discover and refresh in the background of a restored entry.
+
+        Discovery is retried with a growing delay until it succeeds, while the
+        scheduled polls keep the restored entities up to date or unavailable.
+        """
+        delay = DISCOVERY_RETRY_DELAY
+        while True:
+            try:
+                await self._async_setup()
+                break
+            except ConfigEntryAuthFailed as e:
+                LOGGER.error(f"Authentication failed: {e}")
+                self.config_entry.async_start_reauth(self.hass)
+                return
+            except UpdateFailed as e:
+                LOGGER.warning(f"{e}, retrying in {delay} seconds")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, DISCOVERY_RETRY_MAX_DELAY)
+        await self.async_refresh()
+
+    async def _async_write(self) -> None:
+        """Flush the coalesced setpoint writes."""
+        try:
+            await self.hass.async_add_executor_job(self.client.write)
+        except FebosError as e:
+            LOGGER.error(f"Unable to write setpoints: {e}")
+            await self.async_request_refresh()
+        await self._async_save_session()
+
+    async def async_set_setpoint(self, key: str, value: float) -> None:
+        """Optimistically set a setpoint and schedule a debounced write."""
+        resource = self.client.resources[key]
+        raw = SETPOINT_MAP[resource.id].to_raw(value)
+        self.client.set_pending(key, raw)
+        await self._write_debouncer.async_call()
+
+    async def async_shutdown(self) -> None:
+        """Flush pending writes and the startup cache, and cancel listeners."""
+        await super().async_shutdown()
+        self._async_stop_burst()
+        if (profiler := self._profiler) is not None:
+            self._profiler = None
+            await self.hass.async_add_executor_job(profiler.cancel)
+        self._write_debouncer.async_shutdown()
+        if self.client.pending:
+            await self._async_write()
+        if self._unsub_save is not None:
+            self._unsub_save()
+            self._unsub_save = None
+        await self.store.async_save(self.client.as_dict())
@@ -0,0 +1,77 @@
+"""Options and fixtures of the EmmeTI Febos load harness."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import tempfile
+
+import pytest
+
+pytest_plugins = ["pytest_homeassistant_custom_component"]
+
+INTEGRATION_DIR = Path(__file__).resolve().parents[2]
+
+RESULTS = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the scale and cloud options."""
+    group = parser.getgroup("febos load harness")
+    group.addoption("--accounts", type=int, nargs="+", default=[1, 10])
+    group.addoption("--installations", type=int, nargs="+", default=[1])
+    group.addoption("--registers", type=int, default=200)
+    group.addoption("--latency", type=float, default=0.2)
+    group.addoption("--error-rate", type=float, default=0.0)
+    group.addoption("--session-ttl", type=float, default=3600.0)
+    group.addoption("--polls", type=int, default=5)
+    group.addoption("--interval", type=float, default=1.0)
+    group.addoption("--write-rate", type=float, default=0.0)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Make the integration importable as custom_components.febos.
+
+    The repository root is the integration directory, so it is linked into a
+    temporary custom_components package.
+    """
+    root = Path(tempfile.mkdtemp(prefix="febos_harness_"))
+    package = root / "custom_components"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    (package / "febos").symlink_to(INTEGRATION_DIR, target_is_directory=True)
+    sys.path.insert(0, str(root))
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run the harness once per scale step."""
+    if "scale" in metafunc.fixturenames:
+        options = metafunc.config.option
+        steps = [(a, i) for a in options.accounts for i in options.installations]
+        metafunc.parametrize(
+            "scale", steps, ids=[f"{a}x{i}" for a, i in steps], scope="function"
+        )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def results() -> list[dict]:
+    """Collect the metrics of every scale step."""
+    return RESULTS
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """Print the collected metrics as a table."""
+    if not RESULTS:
+        return
+    terminalreporter.write_line("\t".join(RESULTS[0]))
+    for row in RESULTS:
+        terminalreporter.write_line(
+            "\t".join(
+                f"{v:.3f}" if isinstance(v, float) else str(v) for v in row.values()
+            )
+        )
@@ -0,0 +1,201 @@
+"""Local stand-in for the Febos cloud, served over HTTP.
+
+FebosCloud serves synthetic accounts with configurable latency, error rate,
+session expiry and payload size. The harness redirects the requests of the
+real FebosApi here, so its HTTP, JSON parsing and session handling run as
+they would against the cloud.
+
+The paths in ENDPOINTS and the shape of the JSON bodies mirror the methods
+and attributes of febos.api used by the integration. They have not been
+checked against the febos library: align them with it before trusting any
+numbers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import secrets
+import time
+
+from aiohttp import web
+
+ENDPOINTS = {
+    "login": "/login",
+    "page_config": "/installations/{installation_id}/page-config",
+    "realtime_data": "/installations/{installation_id}/realtime-data",
+    "febos_slave": "/installations/{installation_id}/devices/{device_id}/slaves",
+    "write_data": "/installations/{installation_id}/write-data",
+}
+
+
+class FebosCloud:
+    """HTTP server imitating the Febos endpoints for synthetic accounts."""
+
+    def __init__(
+        self,
+        installations: int,
+        codes: list[tuple[str, str, str | None]],
+        latency: float,
+        error_rate: float,
+        session_ttl: float,
+    ) -> None:
+        """Initialize a server whose accounts all have the same installations.
+
+        Codes are (code, inputType, measUnit) triples exposed by each thing.
+        """
+        self.installations = installations
+        self.codes = codes
+        self.latency = latency
+        self.error_rate = error_rate
+        self.session_ttl = session_ttl
+        self.requests = 0
+        self.errors = 0
+        self.logins = 0
+        self.sessions = {}
+        self.accounts = {}
+        self.written = {}
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_post(ENDPOINTS["login"], self._login)
+        self.app.router.add_get(ENDPOINTS["page_config"], self._page_config)
+        self.app.router.add_post(ENDPOINTS["realtime_data"], self._realtime_data)
+        self.app.router.add_get(ENDPOINTS["febos_slave"], self._febos_slave)
+        self.app.router.add_post(ENDPOINTS["write_data"], self._write_data)
+        self._runner = None
+
+    async def start(self) -> str:
+        """Start serving on a free local port and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """Add latency, inject errors and check the session."""
+        self.requests += 1
+        await asyncio.sleep(random.uniform(0.5, 1.5) * self.latency)
+        if random.random() < self.error_rate:
+            self.errors += 1
+            raise web.HTTPInternalServerError(text="Injected error")
+        if handler != self._login:
+            token = request.cookies.get("token") or request.headers.get(
+                "Authorization", ""
+            ).removeprefix("Bearer ")
+            session = self.sessions.get(token)
+            if session is None or time.monotonic() > session[1]:
+                raise web.HTTPUnauthorized(text="Session expired")
+            request["username"] = session[0]
+        return await handler(request)
+
+    def _installation_ids(self, username: str) -> list[int]:
+        """Return the installations of an account, numbering them per account."""
+        account = self.accounts.setdefault(username, len(self.accounts))
+        base = 1000 * (account + 1)
+        return [base + i for i in range(self.installations)]
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Open a session for any credentials."""
+        body = await request.json()
+        self.logins += 1
+        token = secrets.token_hex(16)
+        self.sessions[token] = (
+            body["username"],
+            time.monotonic() + self.session_ttl,
+        )
+        response = web.json_response(
+            {
+                "token": token,
+                "installationIdList": self._installation_ids(body["username"]),
+            }
+        )
+        response.set_cookie("token", token)
+        return response
+
+    async def _page_config(self, request: web.Request) -> web.Response:
+        """Return one device with one thing exposing all codes."""
+        installation_id = int(request.match_info["installation_id"])
+        device_id = installation_id * 10
+        thing_id = installation_id * 100
+        inputs = [
+            {
+                "label": f"{code}: Register",
+                "inputType": input_type,
+                "measUnit": unit,
+                "code": code,
+                "deviceId": device_id,
+                "thingId": thing_id,
+            }
+            for code, input_type, unit in self.codes
+        ]
+        group = {"inputGroupGetCode": "G1", "inputList": inputs}
+        widget = {"widgetInputGroupList": [group]}
+        return web.json_response(
+            {
+                "deviceMap": {
+                    str(device_id): {
+                        "id": device_id,
+                        "installationId": installation_id,
+                        "modelName": "Febos",
+                        "tenantName": "EmmeTI",
+                    }
+                },
+                "thingMap": {
+                    str(thing_id): {
+                        "id": thing_id,
+                        "deviceId": device_id,
+                        "modelName": "Thing",
+                    }
+                },
+                "pageMap": {"home": {"tabList": [{"widgetList": [widget]}]}},
+            }
+        )
+
+    async def _realtime_data(self, request: web.Request) -> web.Response:
+        """Return random values for all codes, or the last written ones."""
+        installation_id = int(request.match_info["installation_id"])
+        return web.json_response(
+            [
+                {
+                    "deviceId": installation_id * 10,
+                    "thingId": installation_id * 100,
+                    "data": {
+                        code: {
+                            "i": self.written.get(
+                                (installation_id, code),
+                                random.randint(0, 1 if t == "BOOL" else 9),
+                            )
+                        }
+                        for code, t, _ in self.codes
+                    },
+                }
+            ]
+        )
+
+    async def _febos_slave(self, request: web.Request) -> web.Response:
+        """Return one slave."""
+        return web.json_response(
+            [
+                {
+                    "indirizzoSlave": 1,
+                    "callTemp": random.randint(0, 1),
+                    "temp": random.randint(180, 220),
+                }
+            ]
+        )
+
+    async def _write_data(self, request: web.Request) -> web.Response:
+        """Store written values, returned by later reads."""
+        installation_id = int(request.match_info["installation_id"])
+        body = await request.json()
+        for code, value in body["data"].items():
+            self.written[installation_id, code] = value
+        return web.json_response({})
@@ -0,0 +1,199 @@
+"""EmmeTI Febos end-to-end load harness.
+
+Starts many config entries inside a test Home Assistant instance against
+FebosCloud, a local HTTP stand-in for the Febos cloud, and measures how
+polling scales with accounts and installations. Requests the real FebosApi
+sends through requests are redirected to the local server.
+
+Development only: this directory is not part of the integration. Run from
+the repository root with the Home Assistant custom component test plugin:
+
+    pytest dev/load_harness -s --accounts 1 10 50 --installations 1 3
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import contextmanager
+import random
+import statistics
+import time
+import tracemalloc
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from requests.adapters import HTTPAdapter
+
+from custom_components.febos.const import CONF_MIN_AGE, DOMAIN
+from custom_components.febos.febos import BINARY_SENSOR_DEVICE_CLASS_MAP, SETPOINT_MAP
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from server import FebosCloud
+
+SETPOINT_CODE = "R16494"
+
+
+def register_codes(registers: int) -> list[tuple[str, str, str | None]]:
+    """Return a setpoint, binary sensors and power sensors up to a count."""
+    binary_codes = list(BINARY_SENSOR_DEVICE_CLASS_MAP)
+    codes = [(SETPOINT_CODE, "INT", "°C")]
+    for n in range(registers - 1):
+        if n < len(binary_codes):
+            codes.append((binary_codes[n], "BOOL", None))
+        else:
+            codes.append((f"R{20000 + n}", "INT", "watt"))
+    return codes
+
+
+@contextmanager
+def redirect_requests(base_url: str):
+    """Send every requests call to the local server, keeping its path.
+
+    The original URL is put back before returning, so the session stores
+    cookies for the cloud host, as it would in production.
+    """
+    send = HTTPAdapter.send
+
+    def redirected_send(self, request, **kwargs):
+        url = request.url
+        parts = urlsplit(url)
+        request.url = base_url + parts.path + (f"?{parts.query}" if parts.query else "")
+        try:
+            response = send(self, request, **kwargs)
+        finally:
+            request.url = url
+        response.url = url
+        return response
+
+    with patch.object(HTTPAdapter, "send", redirected_send):
+        yield
+
+
+async def test_load(
+    hass: HomeAssistant, request, scale: tuple[int, int], results: list[dict]
+) -> None:
+    """Poll a number of accounts and record the collected metrics."""
+    accounts, installations = scale
+    options = request.config.option
+    cloud = FebosCloud(
+        installations,
+        register_codes(options.registers),
+        options.latency,
+        options.error_rate,
+        options.session_ttl,
+    )
+    base_url = await cloud.start()
+
+    state_writes = 0
+    waits = []
+    durations = []
+    lag = []
+    failed_polls = 0
+    register_writes = 0
+
+    @callback
+    def count_state_write(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    add_executor_job = HomeAssistant.async_add_executor_job
+
+    @callback
+    def timed_executor_job(self, target, *args):
+        submitted = time.monotonic()
+
+        def job():
+            waits.append(time.monotonic() - submitted)
+            return target(*args)
+
+        return add_executor_job(self, job)
+
+    stop = asyncio.Event()
+
+    async def probe():
+        while not stop.is_set():
+            start = time.monotonic()
+            await asyncio.sleep(0.05)
+            lag.append(time.monotonic() - start - 0.05)
+
+    async def poll(coordinator):
+        nonlocal failed_polls, register_writes
+        setpoints = [
+            k for k, r in coordinator.client.resources.items() if r.id in SETPOINT_MAP
+        ]
+        for _ in range(options.polls):
+            start = time.monotonic()
+            await coordinator.async_refresh()
+            durations.append(time.monotonic() - start)
+            if not coordinator.last_update_success:
+                failed_polls += 1
+            if (
+                coordinator.client.supports_write
+                and random.random() < options.write_rate
+            ):
+                for key in setpoints:
+                    await coordinator.async_set_setpoint(
+                        key, random.randint(400, 600) / 10
+                    )
+                    register_writes += 1
+            await asyncio.sleep(options.interval)
+
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=f"user{n}",
+            data={CONF_USERNAME: f"user{n}", CONF_PASSWORD: "password"},
+            options={CONF_MIN_AGE: 0},
+        )
+        for n in range(accounts)
+    ]
+    tracemalloc.start()
+    probe_task = hass.async_create_background_task(probe(), "febos_harness_probe")
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_write)
+    started = time.monotonic()
+    try:
+        with (
+            redirect_requests(base_url),
+            patch.object(
+                HomeAssistant, "async_add_executor_job", timed_executor_job
+            ),
+        ):
+            for entry in entries:
+                entry.add_to_hass(hass)
+                await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            loaded = [e for e in entries if e.state is ConfigEntryState.LOADED]
+            await asyncio.gather(*(poll(e.runtime_data) for e in loaded))
+            elapsed = time.monotonic() - started
+            for entry in loaded:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+    finally:
+        unsub()
+        stop.set()
+        await probe_task
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await cloud.stop()
+
+    results.append(
+        {
+            "accounts": accounts,
+            "installations": installations,
+            "loaded": len(loaded),
+            "poll_p50": statistics.median(durations) if durations else 0.0,
+            "poll_max": max(durations, default=0.0),
+            "loop_lag_max": max(lag, default=0.0),
+            "executor_wait_max": max(waits, default=0.0),
+            "state_writes_per_s": state_writes / elapsed,
+            "register_writes": register_writes,
+            "failed_polls": failed_polls,
+            "http_requests": cloud.requests,
+            "http_errors": cloud.errors,
+            "logins": cloud.logins,
+            "peak_mib": peak / 2**20,
+        }
+    )
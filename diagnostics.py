@@ -0,0 +1,30 @@
+"""EmmeTI Febos diagnostics."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .coordinator import FebosConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: FebosConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    client = coordinator.client
+    now = time.time()
+    return {
+        "resources": len(client.resources),
+        "entities": len(coordinator.entities),
+        "stale_after": coordinator.stale_after,
+        "stale": sorted(coordinator.stale),
+        "unknown": dict(client.unknown),
+        "freshness": {
+            key: {"received_age": now - received, "changed_age": now - changed}
+            for key, (received, changed) in client.freshness.as_dict().items()
+        },
+    }
@@ -0,0 +1,119 @@
+"""EmmeTI Febos base entity."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER
+from .coordinator import FebosConfigEntry, FebosDataUpdateCoordinator
+from .febos import FebosResourceData
+
+
+class FebosEntity(CoordinatorEntity[FebosDataUpdateCoordinator]):
+    """Defines an EmmeTI Febos entity backed by a resource."""
+
+    _unrecorded_attributes = frozenset({"last_value_changed"})
+
+    def __init__(
+        self,
+        coordinator: FebosDataUpdateCoordinator,
+        key: str,
+        device_info: DeviceInfo,
+        resource: FebosResourceData,
+    ) -> None:
+        """Initialize EmmeTI Febos entity."""
+        super().__init__(coordinator)
+        self._attr_should_poll = False
+        self._attr_unique_id = key
+        self._attr_device_info = device_info
+        self._attr_name = resource.name
+        self.resource = resource
+
+    async def async_added_to_hass(self) -> None:
+        """Listen to the resource once the entity is added and enabled."""
+        await super().async_added_to_hass()
+        self.resource.listeners.append(self.schedule_update_ha_state)
+        self.async_on_remove(
+            partial(self.resource.listeners.remove, self.schedule_update_ha_state)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return False when the register has gone stale."""
+        return super().available and self._attr_unique_id not in self.coordinator.stale
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the value of the register last changed.
+
+        State is only written when the value changes, so the time the value
+        was last received is exposed through diagnostics and the snapshot.
+        """
+        changed = self.coordinator.client.freshness.last_changed(
+            self._attr_unique_id
+        )
+        if changed is None:
+            return {}
+        return {"last_value_changed": dt_util.utc_from_timestamp(changed).isoformat()}
+
+    @classmethod
+    def create(
+        cls,
+        key: str,
+        resource: FebosResourceData,
+        coordinator: FebosDataUpdateCoordinator,
+    ):
+        """Create an EmmeTI Febos entity and bind it to its resource."""
+        entity = cls(
+            coordinator=coordinator,
+            key=key,
+            device_info=coordinator.client.services["_".join(key.split("_")[:-1])],
+            resource=resource,
+        )
+        coordinator.entities.setdefault(key, []).append(entity)
+        return entity
+
+
+def async_setup_resource_entities(
+    entry: FebosConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    platform: Platform,
+    entity_class: type[FebosEntity],
+) -> None:
+    """Add the entities of a platform, now and whenever new resources appear."""
+    coordinator = entry.runtime_data
+
+    @callback
+    def async_add_resources(keys: list[str]) -> None:
+        entities = []
+        for key in keys:
+            resource = coordinator.client.resources.get(key)
+            if (
+                resource is not None
+                and platform in resource.platforms
+                and resource.value is not None
+                and not any(
+                    isinstance(e, entity_class)
+                    for e in coordinator.entities.get(key, [])
+                )
+            ):
+                entities.append(entity_class.create(key, resource, coordinator))
+        if entities:
+            LOGGER.debug(f"Loading {len(entities)} {platform} entities.")
+            async_add_entities(entities)
+
+    async_add_resources(list(coordinator.client.resources))
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            coordinator.hass, coordinator.signal_new_resources, async_add_resources
+        )
+    )
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import hashlib
+import json
+import threading
+import time
 from typing import Any
 
 from febos.api import Device, FebosApi, Input, Slave, Thing
-from febos.errors import AuthenticationError
+from febos.errors import AuthenticationError, FebosError
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
@@ -25,7 +32,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, PARSER_VERSION, SESSION_MAX_AGE
 
 
 def unique_key(*args) -> str:
@@ -35,6 +42,14 @@ def unique_key(*args) -> str:
     )
 
 
+def fingerprint(*args) -> str:
+    """Hash the content of a list of Febos API objects."""
+    content = json.dumps(
+        args, default=lambda o: getattr(o, "__dict__", str(o)), sort_keys=True
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
 def int16(v):
     """Convert a two's complement 16-bits integer into an int."""
     v = int(v)
@@ -221,6 +236,8 @@ INPUT_TYPE_MAP = {
     "STRING": str,
 }
 
+VALUE_TYPE_MAP = {t.__name__: t for t in INPUT_TYPE_MAP.values()}
+
 
 SENSOR_VALUE_MAP = {
     "R9120": lambda v: float(v) * 60.0,
@@ -296,6 +313,48 @@ BINARY_SENSOR_VALUE_MAP = {
 }
 
 
+@dataclass(frozen=True)
+class FebosSetpoint:
+    """Writable EmmeTI Febos setpoint register.
+
+    No operating range is published for these registers, so only the range
+    of their non-negative 16-bit encoding is enforced: the device validates
+    the value itself. The scale matches the decoding in SENSOR_VALUE_MAP.
+    """
+
+    scale: float = 1.0
+
+    @property
+    def min_value(self) -> float:
+        """Return the lowest value the register can hold."""
+        return 0.0
+
+    @property
+    def max_value(self) -> float:
+        """Return the highest value the register can hold."""
+        return 32767 / self.scale
+
+    @property
+    def step(self) -> float:
+        """Return the resolution of the register."""
+        return 1 / self.scale
+
+    def to_raw(self, value: float) -> int:
+        """Convert a setpoint value into the raw register value."""
+        return int(round(value * self.scale))
+
+
+SETPOINT_MAP = {
+    "R16494": FebosSetpoint(10.0),  # Set temp. della prima richiesta ACS
+    "R16495": FebosSetpoint(10.0),  # Set temp. della seconda richiesta ACS
+    "R16496": FebosSetpoint(10.0),  # Set temp. della seconda richiesta ACS
+    "R16497": FebosSetpoint(10.0),  # Set temp. di mantenimento ACS
+    "R16515": FebosSetpoint(10.0),  # Set di Rugiada/Umidita
+    "R8660": FebosSetpoint(),  # Set umidità estate (SetRh_E)
+    "R8661": FebosSetpoint(),  # Set umidità inverno (SetRh_I)
+}
+
+
 @dataclass
 class FebosResourceData:
     """Parsed EmmeTI Febos resource."""
@@ -308,25 +367,74 @@ class FebosResourceData:
     state_class: SensorStateClass = None
     meas_unit: str = None
     value: Any = None
-    listener: Callable = None
+    listeners: list[Callable] = field(default_factory=list)
+
+    @property
+    def platforms(self) -> list[Platform]:
+        """Return the platforms exposing this resource."""
+        if self.id in SETPOINT_MAP:
+            return [self.type, Platform.NUMBER]
+        return [self.type]
 
-    def set_value(self, value: Any) -> None:
-        """Set current value."""
+    def set_value(self, value: Any) -> bool:
+        """Set current value and return whether it changed."""
         old_value = self.value
         self.value = self.value_type(value)
-        if self.listener is not None and old_value != self.value:
-            self.listener()
+        changed = old_value != self.value
+        if changed:
+            for listener in list(self.listeners):
+                listener()
+        return changed
 
     def get_value(self) -> Any:
         """Return current value."""
-        if self.value is None:
+        return self.decode(self.value)
+
+    def decode(self, value: Any) -> Any:
+        """Decode a raw value of this resource."""
+        if value is None:
             return None
         if self.type == Platform.SENSOR:
-            return SENSOR_VALUE_MAP.get(self.id, lambda v: v)(self.value)
+            return SENSOR_VALUE_MAP.get(self.id, lambda v: v)(value)
         if self.type == Platform.BINARY_SENSOR:
-            return BINARY_SENSOR_VALUE_MAP[self.sensor_class](self.value)
+            return BINARY_SENSOR_VALUE_MAP[self.sensor_class](value)
         raise ValueError(self.type)
 
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize the resource for the startup cache."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "sensor_class": self.sensor_class,
+            "value_type": self.value_type.__name__,
+            "state_class": self.state_class,
+            "meas_unit": self.meas_unit,
+            "value": self.value,
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]):
+        """Deserialize a resource from the startup cache."""
+        platform = Platform(data["type"])
+        sensor_class = data["sensor_class"]
+        if sensor_class is not None:
+            if platform == Platform.BINARY_SENSOR:
+                sensor_class = BinarySensorDeviceClass(sensor_class)
+            else:
+                sensor_class = SensorDeviceClass(sensor_class)
+        state_class = data["state_class"]
+        return FebosResourceData(
+            id=data["id"],
+            name=data["name"],
+            type=platform,
+            sensor_class=sensor_class,
+            value_type=VALUE_TYPE_MAP[data["value_type"]],
+            state_class=SensorStateClass(state_class) if state_class else None,
+            meas_unit=data["meas_unit"],
+            value=data["value"],
+        )
+
     def _parse_binary_sensor_value(self):
         """Normalize the binary sensor value."""
         if self.value is None:
@@ -422,6 +530,70 @@ class FebosResourceData:
         raise ValueError(resource)
 
 
+class FebosFreshness:
+    """Last-received and last-changed times of the resources.
+
+    Timestamps are kept in two parallel arrays of doubles, indexed by a slot
+    assigned to each resource key the first time it is seen.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.slots = {}
+        self.received = array("d")
+        self.changed = array("d")
+
+    def slot(self, key: str, now: float) -> int:
+        """Return the slot of a resource, allocating it if needed."""
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.received)
+            self.received.append(now)
+            self.changed.append(now)
+        return slot
+
+    def touch(self, key: str, changed: bool, now: float) -> None:
+        """Record that a value was received and whether it changed."""
+        slot = self.slot(key, now)
+        self.received[slot] = now
+        if changed:
+            self.changed[slot] = now
+
+    def last_received(self, key: str) -> float | None:
+        """Return the time a value was last received."""
+        slot = self.slots.get(key)
+        return None if slot is None else self.received[slot]
+
+    def last_changed(self, key: str) -> float | None:
+        """Return the time a value last changed."""
+        slot = self.slots.get(key)
+        return None if slot is None else self.changed[slot]
+
+    def stale(self, max_age: float, now: float) -> set[str]:
+        """Return the keys that have not been received for max_age seconds."""
+        limit = now - max_age
+        received = self.received
+        return {k for k, slot in list(self.slots.items()) if received[slot] < limit}
+
+    def as_dict(self) -> dict[str, list[float]]:
+        """Serialize the store for the startup cache."""
+        return {
+            k: [self.received[slot], self.changed[slot]]
+            for k, slot in dict(self.slots).items()
+        }
+
+    def restore(self, data: dict[str, list[float]], now: float) -> None:
+        """Restore last-changed times, treating restored values as just received."""
+        for key, (_, changed) in data.items():
+            self.changed[self.slot(key, now)] = changed
+
+
+BURST_SENSOR_CLASSES = [
+    SensorDeviceClass.POWER,
+    SensorDeviceClass.TEMPERATURE,
+]
+
+
 SLAVE_RESOURCES = {
     "callTemp": FebosResourceData(
         id="S01",
@@ -484,14 +656,30 @@ SLAVE_RESOURCES = {
 class FebosClient:
     """EmmeTI Febos client."""
 
-    def __init__(self, api: FebosApi) -> None:
+    def __init__(self, api: FebosApi, min_age: float = 0.0) -> None:
         """Initialize a client."""
         self.api = api
+        self.min_age = min_age
+        self.last_update = None
+        self._flight = None
+        self._flight_lock = threading.Lock()
+        self._api_lock = threading.Lock()
+        self._changes_lock = threading.Lock()
         self.groups = set()
         self.installations = []
         self.devices = {}
         self.resources = {}
         self.services = {}
+        self.addresses = {}
+        self.pending = {}
+        self.unknown = Counter()
+        self.freshness = FebosFreshness()
+        self.fingerprints = {}
+        self.burst_groups = set()
+        self.changes = {}
+        self.logged_in = False
+        self.session_changed = False
+        self.rediscover_queue = set()
 
     def add_service(self, device: Device, service: Thing | Slave) -> None:
         """Add a service for a given device and thing or slave."""
@@ -511,89 +699,438 @@ class FebosClient:
                 name=service_name,
             )
 
-    def set_value(self, key: str, value: Any) -> None:
-        """Handle value update of a resource."""
+    def add_resource(self, key: str, resource: FebosResourceData) -> None:
+        """Add a resource, updating the existing one bound to its entities.
+
+        The metadata of a rediscovered resource is replaced in place, while
+        its value and listeners are kept.
+        """
+        existing = self.resources.get(key)
+        if existing is None:
+            self.resources[key] = resource
+            return
+        existing.id = resource.id
+        existing.name = resource.name
+        existing.type = resource.type
+        existing.sensor_class = resource.sensor_class
+        existing.value_type = resource.value_type
+        existing.state_class = resource.state_class
+        existing.meas_unit = resource.meas_unit
+
+    def remove_resource(self, key: str) -> None:
+        """Forget a resource that is no longer listed by its installation."""
+        LOGGER.debug(f"Removing resource {key}.")
+        self.resources.pop(key, None)
+        self.addresses.pop(key, None)
+        self.pending.pop(key, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize services and resources for the startup cache.
+
+        The containers are copied first, since discovery may grow them from an
+        executor thread while the cache is saved from the event loop.
+        """
+        services = dict(self.services)
+        resources = dict(self.resources)
+        addresses = dict(self.addresses)
+        return {
+            "installations": list(self.installations),
+            "groups": sorted(set(self.groups)),
+            "burst_groups": sorted(set(self.burst_groups)),
+            "devices": list(dict(self.devices)),
+            "services": {
+                k: {**v, "identifiers": [list(i) for i in v["identifiers"]]}
+                for k, v in services.items()
+            },
+            "resources": {k: r.as_dict() for k, r in resources.items()},
+            "addresses": {k: list(a) for k, a in addresses.items()},
+            "freshness": self.freshness.as_dict(),
+            "fingerprints": deepcopy(self.fingerprints),
+            "parser_version": PARSER_VERSION,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore services and resources from the startup cache.
+
+        The fingerprints are dropped when the resources were parsed by another
+        parser version, so the next discovery rebuilds every device.
+        """
+        self.installations = data["installations"]
+        self.groups = set(data["groups"])
+        self.burst_groups = set(data.get("burst_groups", []))
+        self.devices = dict.fromkeys(data["devices"])
+        self.services = {
+            k: DeviceInfo(
+                **{
+                    **v,
+                    "identifiers": {tuple(i) for i in v["identifiers"]},
+                    "entry_type": DeviceEntryType(v["entry_type"]),
+                }
+            )
+            for k, v in data["services"].items()
+        }
+        self.resources = {
+            k: FebosResourceData.from_dict(r) for k, r in data["resources"].items()
+        }
+        self.addresses = {k: tuple(a) for k, a in data["addresses"].items()}
+        self.fingerprints = data.get("fingerprints", {})
+        if data.get("parser_version") != PARSER_VERSION:
+            LOGGER.debug("Resources cached by another parser, rebuilding.")
+            self.fingerprints = {}
+        now = time.time()
+        for key in self.resources:
+            self.freshness.slot(key, now)
+        self.freshness.restore(data.get("freshness", {}), now)
+
+    def pop_changes(self) -> dict[str, tuple[str, Any, Any]]:
+        """Return the (code, old, new) values changed since the last call."""
+        with self._changes_lock:
+            changes, self.changes = self.changes, {}
+        return changes
+
+    def snapshot(self, installation_id: int | None = None) -> Iterator[dict]:
+        """Yield the raw and decoded value of every resource of an installation."""
+        if installation_id is not None:
+            installation_id = str(installation_id)
+        for key, resource in list(self.resources.items()):
+            installation, device_id, thing_id, code = self.addresses.get(
+                key, (None, None, None, resource.id)
+            )
+            if installation_id is not None and str(installation) != installation_id:
+                continue
+            yield {
+                "key": key,
+                "installation_id": installation,
+                "device_id": device_id,
+                "thing_id": thing_id,
+                "code": code,
+                "name": resource.name,
+                "raw": resource.value,
+                "value": resource.get_value(),
+                "unit": resource.meas_unit,
+                "last_received": self.freshness.last_received(key),
+                "last_changed": self.freshness.last_changed(key),
+            }
+
+    def set_value(self, key: str, value: Any, source: tuple | None = None) -> None:
+        """Handle value update of a resource.
+
+        Unknown codes are counted and logged once; their device or thing, given
+        as an (installation, device, thing) source, is queued for rediscovery.
+        """
         if key in self.resources:
-            self.resources[key].set_value(value)
-        else:
-            LOGGER.warning(f"Resource not found: {key}")
+            resource = self.resources[key]
+            old_value = resource.value
+            changed = resource.set_value(value)
+            self.freshness.touch(key, changed, time.time())
+            if changed:
+                self.record_change(key, resource, old_value)
+            return
+        self.unknown[key] += 1
+        if self.unknown[key] > 1:
+            return
+        LOGGER.warning(f"Resource not found: {key}")
+        if source is not None:
+            self.rediscover_queue.add(source)
 
-    def discover(self):
-        """Discover services and resource from the Febos webapp."""
-
-        def discover_slaves(i, d):
-            get_febos_slave = self.api.get_febos_slave(i, d.id)
-            for slave in get_febos_slave:
-                self.add_service(d, slave)
-                for k in slave.__dict__:
-                    if k in SLAVE_RESOURCES:
-                        self.resources[
-                            unique_key(
-                                i,
-                                d.id,
-                                slave.indirizzoSlave,
-                                k,
-                            )
-                        ] = deepcopy(SLAVE_RESOURCES[k])
+    def record_change(
+        self, key: str, resource: FebosResourceData, old_value: Any
+    ) -> None:
+        """Record the change of a resource, unless it is its first value.
 
-        def discover_device(i, d):
-            self.devices[d.id] = d
-            discover_slaves(i, d)
+        The code is recorded along with the values, so the change can be
+        reported even if the resource is pruned before it is popped.
+        """
+        if old_value is None:
+            return
+        with self._changes_lock:
+            _, old, _ = self.changes.get(
+                key, (resource.id, resource.decode(old_value), None)
+            )
+            self.changes[key] = (resource.id, old, resource.get_value())
 
-        def discover_thing(t, d):
-            if t.deviceId in self.devices:
-                self.add_service(self.devices[t.deviceId], t)
-            else:
-                LOGGER.warning(f"Device not found: {t.deviceId}")
+    def set_pending(self, key: str, value: Any) -> None:
+        """Optimistically set a raw value to be written by the next write."""
+        resource = self.resources[key]
+        self.pending[key] = value
+        old_value = resource.value
+        if resource.set_value(value):
+            self.record_change(key, resource, old_value)
 
-        def discover_resource(r):
-            if r.code not in IGNORED_RESOURCES:
-                self.resources[
-                    unique_key(
+    def discover_slaves(self, installation_id: int, device: Device) -> set[str]:
+        """Discover the slaves of a device and return their resource keys."""
+        keys = set()
+        get_febos_slave = self.api.get_febos_slave(installation_id, device.id)
+        for slave in get_febos_slave:
+            self.add_service(device, slave)
+            for k in slave.__dict__:
+                if k in SLAVE_RESOURCES:
+                    key = unique_key(
+                        installation_id, device.id, slave.indirizzoSlave, k
+                    )
+                    self.add_resource(key, deepcopy(SLAVE_RESOURCES[k]))
+                    self.addresses[key] = (
                         installation_id,
-                        r.deviceId,
-                        r.thingId,
-                        r.code,
+                        device.id,
+                        slave.indirizzoSlave,
+                        SLAVE_RESOURCES[k].id,
                     )
-                ] = FebosResourceData.parse(r)
+                    keys.add(key)
+        return keys
 
-        def discover_group(g):
-            self.groups.add(g.inputGroupGetCode)
-            for resource in g.inputList:
-                assert resource.deviceId == device.id
-                discover_resource(resource)
+    def discover_resource(
+        self, installation_id: int, resource: Input, group: str
+    ) -> str | None:
+        """Discover a resource of a thing, read through an input group.
 
-        def list_groups(m):
-            for page in m.values():
-                for tab in page.tabList:
-                    for widget in tab.widgetList:
-                        yield from widget.widgetInputGroupList
+        Return its key, or None when the resource is ignored.
+        """
+        if resource.code in IGNORED_RESOURCES:
+            return None
+        key = unique_key(
+            installation_id, resource.deviceId, resource.thingId, resource.code
+        )
+        self.add_resource(key, FebosResourceData.parse(resource))
+        self.addresses[key] = (
+            installation_id,
+            resource.deviceId,
+            resource.thingId,
+            resource.code,
+        )
+        if self.resources[key].sensor_class in BURST_SENSOR_CLASSES:
+            self.burst_groups.add(group)
+        return key
+
+    @staticmethod
+    def list_groups(page_map):
+        """List the input groups of the pages of an installation."""
+        for page in page_map.values():
+            for tab in page.tabList:
+                for widget in tab.widgetList:
+                    yield from widget.widgetInputGroupList
 
+    def login(self) -> None:
+        """Log in and refresh the list of installations."""
         login = self.api.login()
         self.installations = login.installationIdList
+        self.logged_in = True
+        self.session_changed = True
+        LOGGER.debug("Logged in")
+
+    def export_session(self) -> dict[str, Any] | None:
+        """Serialize the authenticated session, if the API can export it.
+
+        The session token is opaque: it comes from and goes back to the
+        export_session and restore_session methods of the API, when present.
+        """
+        export_session = getattr(self.api, "export_session", None)
+        if not self.logged_in or export_session is None:
+            return None
+        return {
+            "token": export_session(),
+            "installations": list(self.installations),
+            "expires": time.time() + SESSION_MAX_AGE,
+        }
+
+    def restore_session(self, data: dict[str, Any]) -> bool:
+        """Reuse a stored session if it has not expired yet."""
+        restore_session = getattr(self.api, "restore_session", None)
+        if (
+            restore_session is None
+            or "token" not in data
+            or data["expires"] <= time.time()
+        ):
+            return False
+        restore_session(data["token"])
+        self.installations = data["installations"]
+        self.logged_in = True
+        LOGGER.debug("Session restored")
+        return True
+
+    def discover(self):
+        """Discover from the Febos webapp and retry login in case of session timeout."""
+        with self._api_lock:
+            try:
+                self.do_discover()
+            except AuthenticationError as e:
+                LOGGER.debug(f"Session timed out. {e}")
+                self.login()
+                self.do_discover()
+
+    def do_discover(self):
+        """Discover services and resource from the Febos webapp.
+
+        The page config of each installation and each of its devices is
+        fingerprinted: unchanged installations and devices are not rebuilt.
+        Resources of removed devices, and resources a rebuilt device no longer
+        lists, are dropped, and the input groups are recomputed.
+        """
+
+        def discover_thing(t):
+            if t.deviceId in self.devices:
+                self.add_service(self.devices[t.deviceId], t)
+            else:
+                LOGGER.warning(f"Device not found: {t.deviceId}")
+
+        def discover_group(g, d):
+            for resource in g.inputList:
+                assert resource.deviceId == d.id
+                key = self.discover_resource(
+                    installation_id, resource, g.inputGroupGetCode
+                )
+                if key is not None:
+                    seen.add(key)
+
+        self.devices = {}
+        if not self.logged_in or not self.installations:
+            self.login()
+        all_groups = {}
+        present = set()
+        rebuilt = set()
+        seen = set()
         for installation_id in self.installations:
             page_config = self.api.page_config(installation_id)
             for device in page_config.deviceMap.values():
-                discover_device(installation_id, device)
-                for thing in page_config.thingMap.values():
-                    discover_thing(thing, device)
-                for group in list_groups(page_config.pageMap):
-                    discover_group(group)
+                self.devices[device.id] = device
+                present.add((str(installation_id), str(device.id)))
+            groups = list(self.list_groups(page_config.pageMap))
+            all_groups[installation_id] = groups
+            fingerprints = self.fingerprints.setdefault(str(installation_id), {})
+            page_fingerprint = fingerprint(page_config)
+            if fingerprints.get("page_config") == page_fingerprint:
+                LOGGER.debug(f"Page config of {installation_id} unchanged.")
+                continue
+            devices = fingerprints.setdefault("devices", {})
+            for device in page_config.deviceMap.values():
+                things = [
+                    t for t in page_config.thingMap.values() if t.deviceId == device.id
+                ]
+                device_groups = [
+                    g
+                    for g in groups
+                    if any(r.deviceId == device.id for r in g.inputList)
+                ]
+                device_fingerprint = fingerprint(device, things, device_groups)
+                if devices.get(str(device.id)) == device_fingerprint:
+                    continue
+                LOGGER.debug(f"Rebuilding device {device.id}.")
+                rebuilt.add((str(installation_id), str(device.id)))
+                seen.update(self.discover_slaves(installation_id, device))
+                for thing in things:
+                    discover_thing(thing)
+                for group in device_groups:
+                    discover_group(group, device)
+                devices[str(device.id)] = device_fingerprint
+            for device_id in list(devices):
+                if (str(installation_id), device_id) not in present:
+                    del devices[device_id]
+            fingerprints["page_config"] = page_fingerprint
+        installations = {str(i) for i in self.installations}
+        for installation_id in list(self.fingerprints):
+            if installation_id not in installations:
+                del self.fingerprints[installation_id]
+        for key, address in list(self.addresses.items()):
+            device = (str(address[0]), str(address[1]))
+            if device not in present or (device in rebuilt and key not in seen):
+                self.remove_resource(key)
+        self.groups, self.burst_groups = self.list_input_groups(all_groups)
         LOGGER.debug(f"Loaded {len(self.resources)} resources.")
 
-    def do_update(self):
-        """Update values from Febos webapp."""
+    def list_input_groups(self, all_groups: dict) -> tuple[set[str], set[str]]:
+        """Return the input groups to poll and those read during a burst."""
+        groups = set()
+        burst_groups = set()
+        for installation_id, installation_groups in all_groups.items():
+            for group in installation_groups:
+                groups.add(group.inputGroupGetCode)
+                for resource in group.inputList:
+                    key = unique_key(
+                        installation_id,
+                        resource.deviceId,
+                        resource.thingId,
+                        resource.code,
+                    )
+                    resource_data = self.resources.get(key)
+                    if (
+                        resource_data is not None
+                        and resource_data.sensor_class in BURST_SENSOR_CLASSES
+                    ):
+                        burst_groups.add(group.inputGroupGetCode)
+        return groups, burst_groups
+
+    def rediscover(self) -> None:
+        """Rediscover queued sources and retry login in case of session timeout."""
+        with self._api_lock:
+            try:
+                self.do_rediscover()
+            except AuthenticationError as e:
+                LOGGER.debug(f"Session timed out. {e}")
+                self.login()
+                self.do_rediscover()
+
+    def do_rediscover(self) -> None:
+        """Discover only the devices and things that reported unknown codes.
+
+        A source leaves the queue only once it has been rediscovered, so the
+        ones left over by a failed request are retried on the next poll.
+        """
+        page_configs = {}
+        for source in list(self.rediscover_queue):
+            installation_id, device_id, thing_id = source
+            if installation_id not in page_configs:
+                page_configs[installation_id] = self.api.page_config(installation_id)
+            page_config = page_configs[installation_id]
+            device = next(
+                (d for d in page_config.deviceMap.values() if d.id == device_id),
+                None,
+            )
+            if device is None:
+                LOGGER.warning(f"Device not found: {device_id}")
+            elif thing_id is None:
+                LOGGER.debug(f"Rediscovering slaves of {device_id}")
+                self.devices[device.id] = device
+                self.discover_slaves(installation_id, device)
+            else:
+                LOGGER.debug(f"Rediscovering {device_id}/{thing_id}")
+                self.devices[device.id] = device
+                for thing in page_config.thingMap.values():
+                    if thing.id == thing_id:
+                        self.add_service(device, thing)
+                for group in self.list_groups(page_config.pageMap):
+                    for resource in group.inputList:
+                        if (
+                            resource.deviceId == device_id
+                            and resource.thingId == thing_id
+                        ):
+                            self.groups.add(group.inputGroupGetCode)
+                            self.discover_resource(
+                                installation_id, resource, group.inputGroupGetCode
+                            )
+            self.rediscover_queue.discard(source)
+
+    def do_update(self, groups: set[str] | None = None):
+        """Update values from Febos webapp.
+
+        When groups are given only those input groups are read, without slaves.
+        """
         for installation_id in self.installations:
-            realtime_data = self.api.realtime_data(installation_id, self.groups)
+            realtime_data = self.api.realtime_data(
+                installation_id, self.groups if groups is None else groups
+            )
             for entry in realtime_data:
                 for code, value in entry.data.items():
                     if code not in IGNORED_RESOURCES:
-                        self.set_value(
-                            unique_key(
-                                installation_id, entry.deviceId, entry.thingId, code
-                            ),
-                            value.i,
+                        key = unique_key(
+                            installation_id, entry.deviceId, entry.thingId, code
                         )
+                        if key not in self.pending:
+                            self.set_value(
+                                key,
+                                value.i,
+                                (installation_id, entry.deviceId, entry.thingId),
+                            )
+            if groups is not None:
+                continue
             for device_id in self.devices:
                 get_febos_slave = self.api.get_febos_slave(installation_id, device_id)
                 for slave in get_febos_slave:
@@ -607,15 +1144,106 @@ class FebosClient:
                                     k,
                                 ),
                                 getattr(slave, k),
+                                (installation_id, device_id, None),
                             )
 
-    def update(self) -> dict[str, Any]:
-        """Update values from Febos webapp and retry login in case of session timeout."""
+    def fetch(
+        self, groups: set[str] | None = None, blocking: bool = True
+    ) -> dict[str, Any] | None:
+        """Update values from Febos webapp and retry login in case of session timeout.
+
+        Requests to the webapp are serialized. When not blocking, None is
+        returned without fetching if another request is running.
+        """
+        if not self._api_lock.acquire(blocking=blocking):
+            return None
         try:
-            self.do_update()
-        except AuthenticationError as e:
-            LOGGER.debug(f"Session timed out. {e}")
-            self.api.login()
-            LOGGER.debug("Logged in")
-            self.do_update()
+            try:
+                self.do_update(groups)
+            except AuthenticationError as e:
+                LOGGER.debug(f"Session timed out. {e}")
+                self.login()
+                self.do_update(groups)
+        finally:
+            self._api_lock.release()
         return self.resources
+
+    def burst_update(self) -> bool:
+        """Update only the power and temperature groups and return whether it did.
+
+        The tick is skipped while another request to the webapp is running.
+        """
+        if not self.burst_groups:
+            return False
+        if self.fetch(self.burst_groups, blocking=False) is None:
+            LOGGER.debug("Request running, skipping burst poll.")
+            return False
+        return True
+
+    def update(self) -> dict[str, Any]:
+        """Update values, sharing a single fetch among overlapping callers.
+
+        A caller arriving while a fetch is running waits for its result, and a
+        result younger than min_age seconds is returned without fetching.
+        """
+        with self._flight_lock:
+            if (
+                self.last_update is not None
+                and time.monotonic() - self.last_update < self.min_age
+            ):
+                return self.resources
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = Future()
+        if not leader:
+            LOGGER.debug("Joining running update.")
+            return flight.result()
+        try:
+            result = self.fetch()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            self.last_update = time.monotonic()
+            return result
+        finally:
+            with self._flight_lock:
+                self._flight = None
+
+    @property
+    def supports_write(self) -> bool:
+        """Return whether the Febos API can write registers."""
+        return callable(getattr(self.api, "write_data", None))
+
+    def do_write(self, values: dict[str, Any]) -> None:
+        """Write raw register values, batching them in one request per thing."""
+        write_data = getattr(self.api, "write_data", None)
+        if write_data is None:
+            raise FebosError("Register writes are not supported by the Febos API")
+        batches = defaultdict(dict)
+        for key, value in values.items():
+            installation_id, device_id, thing_id, code = self.addresses[key]
+            batches[installation_id, device_id, thing_id][code] = value
+        for (installation_id, device_id, thing_id), data in batches.items():
+            LOGGER.debug(f"Writing {data} to {device_id}/{thing_id}")
+            write_data(installation_id, device_id, thing_id, data)
+
+    def write(self) -> None:
+        """Flush pending setpoint writes and retry login in case of session timeout."""
+        values = dict(self.pending)
+        if not values:
+            return
+        try:
+            with self._api_lock:
+                try:
+                    self.do_write(values)
+                except AuthenticationError as e:
+                    LOGGER.debug(f"Session timed out. {e}")
+                    self.login()
+                    self.do_write(values)
+        finally:
+            for key, value in values.items():
+                if self.pending.get(key) == value:
+                    del self.pending[key]
@@ -0,0 +1,70 @@
+"""EmmeTI Febos number definitions."""
+
+from __future__ import annotations
+
+from homeassistant.components.number import (
+    NumberDeviceClass,
+    NumberEntity,
+    NumberEntityDescription,
+    NumberMode,
+)
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+from .const import LOGGER
+from .coordinator import FebosConfigEntry, FebosDataUpdateCoordinator
+from .entity import FebosEntity, async_setup_resource_entities
+from .febos import SETPOINT_MAP, FebosResourceData
+
+
+class FebosNumberEntity(FebosEntity, NumberEntity):
+    """Defines an EmmeTI Febos writable setpoint."""
+
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: FebosDataUpdateCoordinator,
+        key: str,
+        device_info: DeviceInfo,
+        resource: FebosResourceData,
+    ) -> None:
+        """Initialize EmmeTI Febos setpoint."""
+        super().__init__(coordinator, key, device_info, resource)
+        setpoint = SETPOINT_MAP[resource.id]
+        self.entity_description = NumberEntityDescription(
+            key=key,
+            device_class=NumberDeviceClass(resource.sensor_class)
+            if resource.sensor_class is not None
+            else None,
+            native_unit_of_measurement=resource.meas_unit,
+            native_min_value=setpoint.min_value,
+            native_max_value=setpoint.max_value,
+            native_step=setpoint.step,
+            mode=NumberMode.BOX,
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value of the setpoint."""
+        return self.resource.get_value()
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Update the setpoint."""
+        await self.coordinator.async_set_setpoint(self.unique_id, value)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: FebosConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up a config entry."""
+    if not entry.runtime_data.client.supports_write:
+        LOGGER.debug("Register writes not supported, skipping setpoints.")
+        return
+    async_setup_resource_entities(
+        entry, async_add_entities, Platform.NUMBER, FebosNumberEntity
+    )
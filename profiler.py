@@ -0,0 +1,108 @@
+"""EmmeTI Febos update pipeline profiler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import cProfile
+from functools import partial
+import threading
+import tracemalloc
+from typing import Any
+
+from .const import LOGGER
+
+TRACEMALLOC_TOP = 50
+
+
+class FebosProfiler:
+    """Profile the sections of the next update runs and their allocations.
+
+    Each section, like the executor update or the event loop dispatch, gets
+    its own deterministic profile, so the time spent awaiting is not counted.
+    Allocations are compared between a snapshot taken before the first run
+    and one taken after the last.
+    """
+
+    def __init__(self, runs: int) -> None:
+        """Initialize a profiler for a number of runs."""
+        self.runs = runs
+        self.profiles = {}
+        self._tracemalloc = False
+        self._before = None
+        self._after = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        """Take the allocation snapshot before the first run."""
+        with self._lock:
+            if self._before is not None or self._cancelled:
+                return
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc = True
+            self._before = tracemalloc.take_snapshot()
+
+    def call(self, section: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a function under the profile of a section.
+
+        The function runs unprofiled when another profiler is already active.
+        """
+        profile = self.profiles.setdefault(section, cProfile.Profile())
+        try:
+            profile.enable()
+        except ValueError as e:
+            LOGGER.warning(f"Unable to profile {section}: {e}")
+            return func(*args)
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+
+    def end(self) -> bool:
+        """Finish a run and return whether all runs are done."""
+        with self._lock:
+            if self._cancelled:
+                return False
+            self.runs -= 1
+            if self.runs > 0:
+                return False
+            self._after = tracemalloc.take_snapshot()
+            self._stop_tracemalloc()
+            return True
+
+    def cancel(self) -> None:
+        """Abandon the capture, stopping the allocation tracing it started."""
+        with self._lock:
+            self._cancelled = True
+            self._stop_tracemalloc()
+
+    def _stop_tracemalloc(self) -> None:
+        """Stop tracing allocations, if this profiler started it."""
+        if self._tracemalloc:
+            tracemalloc.stop()
+            self._tracemalloc = False
+
+    def dump(self, prefix: str) -> list[str]:
+        """Write the profiles and the allocation snapshots next to prefix."""
+        paths = []
+        for section, profile in self.profiles.items():
+            paths.append(f"{prefix}_{section}.prof")
+            profile.dump_stats(paths[-1])
+        paths.append(f"{prefix}.tracemalloc")
+        self._after.dump(paths[-1])
+        paths.append(f"{prefix}_tracemalloc.txt")
+        stats = self._after.compare_to(self._before, "lineno")
+        with open(paths[-1], "w", encoding="utf-8") as stream:
+            for stat in stats[:TRACEMALLOC_TOP]:
+                stream.write(f"{stat}\n")
+        return paths
+
+
+def profiled(
+    profiler: FebosProfiler | None, section: str, func: Callable[..., Any]
+) -> Callable[..., Any]:
+    """Return a function profiled under a section while a profile is captured."""
+    if profiler is None:
+        return func
+    return partial(profiler.call, section, func)
@@ -9,14 +9,13 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import LOGGER
 from .coordinator import FebosConfigEntry, FebosDataUpdateCoordinator
+from .entity import FebosEntity, async_setup_resource_entities
 from .febos import FebosResourceData
 
 
-class FebosSensorEntity(CoordinatorEntity[FebosDataUpdateCoordinator], SensorEntity):
+class FebosSensorEntity(FebosEntity, SensorEntity):
     """Defines an EmmeTI Febos sensor."""
 
     def __init__(
@@ -27,38 +26,19 @@ class FebosSensorEntity(CoordinatorEntity[FebosDataUpdateCoordinator], SensorEnt
         resource: FebosResourceData,
     ) -> None:
         """Initialize EmmeTI Febos sensor."""
-        super().__init__(coordinator)
-        self._attr_should_poll = False
+        super().__init__(coordinator, key, device_info, resource)
         self.entity_description = SensorEntityDescription(
             key=key,
             device_class=resource.sensor_class,
             state_class=resource.state_class,
             native_unit_of_measurement=resource.meas_unit,
         )
-        self._attr_unique_id = key
-        self._attr_device_info = device_info
-        self._attr_name = resource.name
-        self.resource = resource
 
     @property
     def native_value(self) -> Any:
         """Return the value of the sensor."""
         return self.resource.get_value()
 
-    @staticmethod
-    def create(
-        key: str, resource: FebosResourceData, coordinator: FebosDataUpdateCoordinator
-    ):
-        """Create an EmmeTI Febos sensor entity."""
-        entity = FebosSensorEntity(
-            coordinator=coordinator,
-            key=key,
-            device_info=coordinator.client.services["_".join(key.split("_")[:-1])],
-            resource=resource,
-        )
-        resource.listener = entity.schedule_update_ha_state
-        return entity
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -66,14 +46,6 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up a config entry."""
-
-    def make_sensor(self):
-        """Create entities from resources."""
-
-    sensors = [
-        FebosSensorEntity.create(k, r, entry.runtime_data)
-        for k, r in entry.runtime_data.client.resources.items()
-        if r.type == Platform.SENSOR and r.value is not None
-    ]
-    LOGGER.debug(f"Loading {len(sensors)} sensors.")
-    async_add_entities(sensors)
+    async_setup_resource_entities(
+        entry, async_add_entities, Platform.SENSOR, FebosSensorEntity
+    )
@@ -0,0 +1,162 @@
+"""EmmeTI Febos services."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import csv
+import io
+import json
+import os
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import FebosConfigEntry
+
+SERVICE_PROFILE = "profile"
+SERVICE_EXPORT_SNAPSHOT = "export_snapshot"
+
+ATTR_RUNS = "runs"
+ATTR_INSTALLATION_ID = "installation_id"
+ATTR_FORMAT = "format"
+ATTR_FILENAME = "filename"
+
+FORMAT_JSON = "json"
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+
+SNAPSHOT_FIELDS = [
+    "key",
+    "installation_id",
+    "device_id",
+    "thing_id",
+    "code",
+    "name",
+    "raw",
+    "value",
+    "unit",
+    "last_received",
+    "last_changed",
+]
+
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_RUNS, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
+SERVICE_EXPORT_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_INSTALLATION_ID): cv.string,
+        vol.Optional(ATTR_FORMAT, default=FORMAT_JSON): vol.In(
+            [FORMAT_JSON, FORMAT_JSONL, FORMAT_CSV]
+        ),
+        vol.Optional(ATTR_FILENAME): cv.string,
+    }
+)
+
+
+def get_entries(hass: HomeAssistant, call: ServiceCall) -> list[FebosConfigEntry]:
+    """Return the loaded config entries targeted by a service call."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    entries = [
+        e
+        for e in hass.config_entries.async_entries(DOMAIN)
+        if e.state is ConfigEntryState.LOADED
+        and (entry_id is None or e.entry_id == entry_id)
+    ]
+    if not entries:
+        raise ServiceValidationError(f"No loaded {DOMAIN} entry found")
+    return entries
+
+
+def write_snapshot(rows: Iterable[dict], fmt: str, stream: io.TextIOBase) -> int:
+    """Write snapshot rows to a stream, one at a time, and return their count."""
+    count = 0
+    if fmt == FORMAT_CSV:
+        writer = csv.DictWriter(stream, SNAPSHOT_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+    if fmt == FORMAT_JSON:
+        stream.write("[")
+    for row in rows:
+        if fmt == FORMAT_JSON and count > 0:
+            stream.write(",")
+        stream.write(json.dumps(row, separators=(",", ":")))
+        if fmt == FORMAT_JSONL:
+            stream.write("\n")
+        count += 1
+    if fmt == FORMAT_JSON:
+        stream.write("]")
+    return count
+
+
+def export_snapshot(rows: Iterable[dict], fmt: str, path: str) -> int:
+    """Stream snapshot rows to a file and return their count."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as stream:
+        return write_snapshot(rows, fmt, stream)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the EmmeTI Febos services."""
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next runs of the update pipeline."""
+        for entry in get_entries(hass, call):
+            entry.runtime_data.async_profile(call.data[ATTR_RUNS])
+
+    async def async_export_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Export the register map of the targeted entries in a single snapshot."""
+        fmt = call.data[ATTR_FORMAT]
+        installation_id = call.data.get(ATTR_INSTALLATION_ID)
+        entries = get_entries(hass, call)
+        rows = (
+            row
+            for entry in entries
+            for row in entry.runtime_data.client.snapshot(installation_id)
+        )
+        if (filename := call.data.get(ATTR_FILENAME)) is not None:
+            if filename in ("", ".", "..") or any(c in filename for c in "/\\"):
+                raise ServiceValidationError(f"Invalid file name: {filename}")
+            path = hass.config.path(DOMAIN, filename)
+            count = await hass.async_add_executor_job(
+                export_snapshot, rows, fmt, path
+            )
+            return {"path": path, "count": count}
+        if fmt == FORMAT_JSON:
+            return {"resources": list(rows)}
+        stream = io.StringIO()
+        count = write_snapshot(rows, fmt, stream)
+        return {"data": stream.getvalue(), "count": count}
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile, schema=SERVICE_PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_SNAPSHOT,
+        async_export_snapshot,
+        schema=SERVICE_EXPORT_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )